@@ -1,6 +1,257 @@
-import csv
+import io
+import os
+import atexit
 import re
+import sys
 import json
+import logging
+from collections import defaultdict, deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from enum import IntEnum
+from functools import lru_cache
+from types import MappingProxyType
+
+try:
+    import orjson  # Parser JSON en C, opcional
+except ImportError:
+    orjson = None
+
+try:
+    import ijson  # Parser JSON incremental, opcional
+except ImportError:
+    ijson = None
+
+# Mensajes de estado del módulo. Por defecto se muestran en la consola igual que con print;
+# para silenciarlos: logging.getLogger("SdM").setLevel(logging.WARNING)
+log = logging.getLogger(__name__)
+
+
+class _ConsolaHandler(logging.StreamHandler):
+    """Handler que escribe en el sys.stdout vigente, como lo haría print (o en el búfer de salida_agrupada)."""
+    _bufer = None
+
+    @property
+    def stream(self):
+        return sys.stdout if self._bufer is None else self._bufer
+
+    @stream.setter
+    def stream(self, valor):
+        pass  # El destino es siempre sys.stdout
+
+
+_consola = _ConsolaHandler()
+_consola.set_name("SdM.consola")
+_consola.setFormatter(logging.Formatter("%(message)s"))
+for _handler in [h for h in log.handlers if h.get_name() == "SdM.consola"]:
+    log.removeHandler(_handler)  # Al recargar el módulo se reemplaza el handler de la carga anterior
+if not log.handlers:
+    log.addHandler(_consola)
+    log.setLevel(logging.INFO)
+    log.propagate = False
+
+
+@contextmanager
+def salida_agrupada():
+    """
+    Junta los mensajes del módulo emitidos dentro del bloque with y los escribe en la consola
+    de una sola vez al salir, en lugar de escribir y vaciar la salida mensaje por mensaje.
+    Pensado para operaciones masivas, como las inscripciones por cohorte. Los listados que se
+    imprimen con print (por ejemplo, mostrar_estudiantes) no se agrupan.
+    """
+    if _consola._bufer is not None:  # Ya hay un bloque activo: los mensajes van a su búfer
+        yield
+        return
+    _consola._bufer = bufer = io.StringIO()
+    try:
+        yield
+    finally:
+        _consola._bufer = None
+        sys.stdout.write(bufer.getvalue())
+
+# Tamaño (en bytes) a partir del cual el plan se lee en modo streaming si ijson está disponible
+UMBRAL_STREAMING = 1024 * 1024
+
+# Validadores compilados una sola vez al importar el módulo
+_NO_VACIO = re.compile(r"\S").search  # Encuentra algún carácter que no sea espacio
+_DIGITOS = re.compile(r"[+-]?\d+").fullmatch  # Texto formado solo por dígitos (número entero)
+
+
+_REQUIERE_COMILLAS = re.compile(r'[,"\r\n]').search  # Caracteres que obligan a encerrar un campo CSV entre comillas
+
+
+def _fila_csv(valores):
+    """
+    Arma una línea de un archivo CSV. Los campos se encierran entre comillas solo cuando
+    contienen comas, comillas o saltos de línea, igual que lo haría csv.writer.
+
+    Args:
+        valores (iterable): Valores de la fila.
+
+    Returns:
+        str: La línea, terminada en salto de línea.
+    """
+    campos = []
+    for valor in valores:
+        texto = str(valor)
+        if _REQUIERE_COMILLAS(texto):
+            texto = '"' + texto.replace('"', '""') + '"'
+        campos.append(texto)
+    return ",".join(campos) + "\r\n"
+
+
+def _escribir_csv(ruta_archivo, encabezado, estudiantes):
+    """
+    Escribe un archivo CSV completo: las líneas de encabezado y una fila (nombre, apellido, cédula)
+    por estudiante. Las filas se codifican en UTF-8 sobre un búfer en memoria y el archivo,
+    abierto en modo binario, se escribe con una sola llamada.
+
+    Args:
+        ruta_archivo (str): Ruta del archivo CSV.
+        encabezado (str): Primeras líneas del archivo, ya armadas.
+        estudiantes (iterable of Estudiante): Estudiantes a listar.
+    """
+    buffer = io.BytesIO()
+    escribir = buffer.write
+    escribir(encabezado.encode("utf-8"))
+    for e in estudiantes:
+        escribir(_fila_csv((e.nombre, e.apellido, e.cedula)).encode("utf-8"))
+    with open(ruta_archivo, "wb") as archivo:
+        archivo.write(buffer.getbuffer())
+
+
+def _es_cedula_valida(cedula):
+    """
+    Indica si una cédula es un entero o un texto formado solo por dígitos.
+
+    Args:
+        cedula (int o str): Cédula a validar.
+
+    Returns:
+        bool: True si la cédula es válida, False en caso contrario.
+    """
+    return type(cedula) is int or (type(cedula) is str and _DIGITOS(cedula.strip()) is not None)
+
+
+@lru_cache(maxsize=1024)
+def _normalizar_nombre(texto):
+    """
+    Quita los espacios de los extremos y pone en mayúscula la inicial de cada palabra.
+    Los nombres y apellidos se repiten mucho, así que el resultado se guarda en caché.
+
+    Args:
+        texto (str): Nombre o apellido a normalizar.
+
+    Returns:
+        str: El texto normalizado (por ejemplo: "  maría-josé " -> "María-José").
+    """
+    return texto.strip().title()
+
+
+@lru_cache(maxsize=8)
+def _leer_json(ruta_archivo, fecha_modificacion):
+    """
+    Lee y decodifica un archivo JSON, guardando el resultado en caché.
+    La fecha de modificación forma parte de la clave, así un archivo editado se vuelve a leer.
+    El diccionario devuelto se comparte entre llamadas y no debe modificarse.
+
+    Args:
+        ruta_archivo (str): Ruta absoluta del archivo JSON.
+        fecha_modificacion (float): Fecha de última modificación del archivo.
+
+    Returns:
+        dict: El contenido del archivo.
+    """
+    with open(ruta_archivo, "rb") as f: # Abre el archivo JSON en modo lectura binaria
+        contenido = f.read()
+    # Se carga el contenido del archivo en un diccionario (con orjson si está instalado)
+    return orjson.loads(contenido) if orjson is not None else json.loads(contenido)
+
+def aplanar_plan_json(ruta_origen, ruta_destino):
+    """
+    Convierte un plan de estudios en JSON del formato por semestre
+    ({"S1": {"UC1S1": {...}}, ...}) al formato plano, una lista de materias
+    ([{"codigo": "UC1S1", "semestre": "S1", ...}, ...]), que se carga con un único bucle.
+    Si el archivo ya está en formato plano no se escribe nada.
+
+    Args:
+        ruta_origen (str): Ruta del archivo JSON con el formato por semestre.
+        ruta_destino (str): Ruta donde escribir el resultado (puede ser la misma que la de origen para sobrescribirlo).
+
+    Returns:
+        bool: True si se convirtió el archivo, False si ya estaba en formato plano.
+
+    Raises:
+        ValueError: Si el archivo no tiene ninguno de los dos formatos.
+    """
+    with open(ruta_origen, "r", encoding="utf-8") as f:
+        datos = json.load(f)
+
+    if isinstance(datos, list): #ya es una lista de materias
+        log.warning("⚠ El archivo %s ya está en formato plano, no se modificó.", ruta_origen)
+        return False
+    if not isinstance(datos, dict):
+        raise ValueError(f"El archivo {ruta_origen} no tiene el formato de un plan de estudios.")
+
+    plano = [
+        {"codigo": codigo, "semestre": semestre, **materia}
+        for semestre, materias in datos.items()
+        for codigo, materia in materias.items()
+    ]
+
+    with open(ruta_destino, "w", encoding="utf-8") as f:
+        json.dump(plano, f, ensure_ascii=False, indent=2)
+    return True
+
+
+# Objetos con cambios que todavía no se escribieron en su archivo CSV
+_pendientes_de_guardar = set()
+
+
+class PersistibleMixin:
+    """
+    Agrega a una clase el guardado diferido de su archivo CSV: cada modificación solo marca
+    el objeto como pendiente, y el archivo se escribe completo una sola vez al llamar a guardar().
+    Los objetos pendientes también se guardan con guardar_pendientes(), al salir de un bloque
+    with de una Coordinadora y al terminar el programa.
+
+    La clase que lo use debe definir el atributo _pendiente y el método privado _escribir_archivo(),
+    que escribe el CSV completo y deja pasar cualquier error de escritura.
+    """
+    __slots__ = ()
+
+    def _marcar_pendiente(self):
+        """Método privado que marca el objeto para que su CSV se escriba en el próximo guardado."""
+        self._pendiente = True
+        _pendientes_de_guardar.add(self)
+
+    def guardar(self):
+        """
+        Escribe el archivo CSV del objeto si tiene cambios sin guardar.
+        Solo se desmarca como pendiente si la escritura terminó bien.
+
+        Raises:
+            OSError: Si no se pudo escribir el archivo (el objeto sigue pendiente).
+        """
+        if self._pendiente:
+            self._escribir_archivo()
+            self._pendiente = False
+        _pendientes_de_guardar.discard(self)
+
+
+def guardar_pendientes():
+    """
+    Escribe los archivos CSV de todos los cursos y exámenes con cambios sin guardar.
+    Si falla la escritura de uno, se informa el error y se sigue con los demás; el que falló queda pendiente.
+    """
+    for objeto in list(_pendientes_de_guardar):
+        try:
+            objeto.guardar()
+        except Exception as e:
+            log.error("✖ Error al guardar el archivo %s: %s", objeto.archivo_csv, e)
+
+
+atexit.register(guardar_pendientes)  # Nada queda sin guardar al terminar el programa
 
 class Persona:
     """
@@ -10,7 +261,9 @@ class Persona:
     nombre_completo():
         Retorna el nombre completo de la persona en formato 'Nombre Apellido'.
     """
-    def __init__(self, nombre, apellido):
+    __slots__ = ("nombre", "apellido")
+
+    def __init__(self, nombre, apellido, validar=True):
         
         """
         Inicializa una nueva instancia de la clase Persona.
@@ -20,20 +273,27 @@ class Persona:
             El nombre de la persona. No debe estar vacío ni ser solo espacios.
         apellido : str
             El apellido de la persona. No debe estar vacío ni ser solo espacios.
+        validar : bool
+            Si es False se omiten la validación y la normalización de los datos.
+            Pensado para cargas masivas de datos que ya fueron validados.
 
         Raise:
         ValueError:
             Si el nombre o el apellido no son cadenas válidas no vacías.
         """
 
-        if not isinstance(nombre, str) or not nombre.strip():
-            raise ValueError("El nombre debe ser una cadena no vacía.")
+        if validar:
+            if type(nombre) is not str or not _NO_VACIO(nombre):
+                raise ValueError("El nombre debe ser una cadena no vacía.")
+
+            if type(apellido) is not str or not _NO_VACIO(apellido):
+                raise ValueError("El apellido debe ser una cadena no vacía.")
 
-        if not isinstance(apellido, str) or not apellido.strip():
-            raise ValueError("El apellido debe ser una cadena no vacía.")
+            nombre = _normalizar_nombre(nombre)
+            apellido = _normalizar_nombre(apellido)
 
-        self.nombre = nombre.strip().title()
-        self.apellido = apellido.strip().title()
+        self.nombre = nombre
+        self.apellido = apellido
     
     def nombre_completo(self):
         """
@@ -45,30 +305,51 @@ class Persona:
         """
         return f"{self.nombre} {self.apellido}"
     
+@dataclass(slots=True, frozen=True)
 class UnidadCurricular:
     """
     Representa una unidad curricular dentro de un plan de estudios.
+    Es inmutable: una vez creada, sus datos no cambian.
 
     Atributos:
         codigo (str): Código único que identifica la unidad curricular.
         nombre (str): Nombre de la unidad curricular.
         creditos (int): Cantidad de créditos otorgados por la unidad.
-        previas (list of str): Lista de códigos de unidades curriculares que deben aprobarse previamente.
+        previas (tuple of str): Códigos de unidades curriculares que deben aprobarse previamente.
+        semestre (int o None): Semestre indicado por el sufijo del código (por ejemplo: UC3S2 -> 2), o None si no tiene.
     """
-    def __init__(self, codigo, nombre, creditos, previas):
+    codigo: str
+    nombre: str
+    creditos: int
+    previas: tuple
+    semestre: int | None = field(init=False, repr=False, compare=False)
+    _previas_busqueda: object = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        """
+        Convierte las previas a tupla si se recibieron como lista, obtiene el semestre del código
+        y prepara la colección usada para consultar si un código es previa (un frozenset cuando
+        hay 4 o más previas, para las listas cortas recorrer la tupla es más rápido que calcular el hash).
         """
-        Inicializa una nueva instancia de la clase UnidadCurricular.
+        if not isinstance(self.previas, tuple):
+            object.__setattr__(self, "previas", tuple(self.previas))
+        _, separador, sufijo = self.codigo.rpartition("S")
+        semestre = int(sufijo) if separador and sufijo.isdecimal() else None
+        object.__setattr__(self, "semestre", semestre)
+        busqueda = frozenset(self.previas) if len(self.previas) >= 4 else self.previas
+        object.__setattr__(self, "_previas_busqueda", busqueda)
+
+    def es_previa(self, codigo):
+        """
+        Indica si una unidad curricular es previa de esta.
 
         Args:
-            codigo (str): Código de la unidad curricular.
-            nombre (str): Nombre de la unidad curricular.
-            creditos (int): Créditos asignados a la unidad curricular.
-            previas (list of str): Unidades curriculares que deben aprobarse antes (requisitos previos).
+            codigo (str): Código de la unidad curricular a consultar.
+
+        Returns:
+            bool: True si el código figura entre las previas, False en caso contrario.
         """
-        self.codigo = codigo
-        self.nombre = nombre
-        self.creditos = creditos
-        self.previas = previas
+        return codigo in self._previas_busqueda
 
 class PlanDeEstudio:
     """
@@ -89,7 +370,11 @@ class PlanDeEstudio:
 
         self.nombre_plan = nombre_plan
         self.materias = []
+        self._materias_por_codigo = {}  # Índice código -> UnidadCurricular para búsquedas directas
+        self._bit_por_codigo = {}  # Código -> bit propio de cada materia (1, 2, 4, ...), para representar conjuntos de materias como enteros
         self._cargar_desde_json(ruta_json)
+        self._ordenar_por_previas()
+        self._resolver_previas()
 
     def _agregar_materia(self, unidad_curricular):
         """
@@ -99,6 +384,9 @@ class PlanDeEstudio:
             unidad_curricular (UnidadCurricular): Objeto de tipo UnidadCurricular a agregar.
         """
         self.materias.append(unidad_curricular)
+        self._materias_por_codigo[unidad_curricular.codigo] = unidad_curricular
+        if unidad_curricular.codigo not in self._bit_por_codigo:
+            self._bit_por_codigo[unidad_curricular.codigo] = 1 << len(self._bit_por_codigo)
 
     def buscar_uc_por_codigo(self, codigo):
         """
@@ -110,47 +398,196 @@ class PlanDeEstudio:
         Returns:
             UnidadCurricular o None: Devuelve la unidad si la encuentra, sino devuelve None.
         """
-        for uc in self.materias:
-            if uc.codigo == codigo:
-                return uc
-        return None
+        return self._materias_por_codigo.get(codigo)
 
     def _cargar_desde_json(self, ruta_archivo):
         """
-        Método privado que carga las materias desde un archivo JSON estructurado por semestre.
+        Método privado que carga las materias desde un archivo JSON estructurado por semestre,
+        o bien en formato plano (una lista de materias, ver aplanar_plan_json).
+        Si ijson está instalado y el archivo supera UMBRAL_STREAMING, la lectura se hace en streaming.
         
         Args:
             ruta_archivo (str): Ruta del archivo JSON a leer.
         """
-        with open(ruta_archivo, "r", encoding="utf-8") as f: # Abre el archivo JSON en modo lectura
-            datos = json.load(f)  # Se carga el contenido del archivo en un diccionario
+        if ijson is not None and os.path.getsize(ruta_archivo) > UMBRAL_STREAMING:
+            self._cargar_desde_json_streaming(ruta_archivo)
+            return
+
+        # Si el mismo archivo ya se leyó (y no cambió), se reutiliza el contenido decodificado
+        ruta_absoluta = os.path.abspath(ruta_archivo)
+        datos = _leer_json(ruta_absoluta, os.path.getmtime(ruta_absoluta))
+
+        if isinstance(datos, list):
+            self._cargar_lista_plana(datos)
+            return
         
+        # Se guardan los métodos en variables locales para no buscarlos en cada vuelta del bucle
+        agregar = self._agregar_materia
+        crear = self._materia_desde_json
         # Itera sobre cada semestre y sus materias
         for semestre, materias in datos.items():
             for codigo, materia in materias.items():
                 # Se crea una nueva instancia de UnidadCurricular con los datos del JSON
-                uc = UnidadCurricular(
-                    codigo=codigo,
-                    nombre=materia["nombre"],
-                    creditos=materia["creditos"],
-                    previas=materia["previas"]
-                )
-                self._agregar_materia(uc)
+                agregar(crear(codigo, materia))
+
+    def _cargar_lista_plana(self, materias):
+        """
+        Método privado que carga las materias desde el formato plano: una lista de diccionarios
+        con "codigo", "semestre", "nombre", "creditos" y "previas". Se recorre con un único bucle.
+
+        Args:
+            materias (iterable of dict): Materias del plan.
+        """
+        # Se guardan los métodos en variables locales para no buscarlos en cada vuelta del bucle
+        agregar = self._agregar_materia
+        crear = self._materia_desde_json
+        for materia in materias:
+            agregar(crear(materia["codigo"], materia))
+
+    @staticmethod
+    def _materia_desde_json(codigo, materia):
+        """
+        Método privado que construye una UnidadCurricular a partir de una entrada del JSON.
+        Los códigos y nombres se internan con sys.intern, así cada texto repetido
+        (por ejemplo, un código que aparece como previa de varias materias) se guarda una sola vez.
+
+        Args:
+            codigo (str): Código de la unidad curricular.
+            materia (dict): Datos de la materia ("nombre", "creditos" y "previas").
+
+        Returns:
+            UnidadCurricular: La unidad curricular construida.
+        """
+        return UnidadCurricular(
+            codigo=sys.intern(codigo),
+            nombre=sys.intern(materia["nombre"]),
+            creditos=int(materia["creditos"]),
+            previas=tuple(sys.intern(previa) for previa in materia["previas"])
+        )
+
+    def _cargar_desde_json_streaming(self, ruta_archivo):
+        """
+        Método privado que carga las materias leyendo el archivo JSON semestre a semestre con ijson,
+        sin construir el diccionario completo del plan en memoria.
+
+        Args:
+            ruta_archivo (str): Ruta del archivo JSON a leer.
+        """
+        with open(ruta_archivo, "rb") as f:
+            # Se mira el primer carácter significativo para saber si el archivo está en formato plano
+            primer_caracter = f.read(1)
+            while primer_caracter.isspace():
+                primer_caracter = f.read(1)
+            f.seek(0)
+            if primer_caracter == b"[":
+                # items entrega cada materia de la lista a medida que la va leyendo
+                self._cargar_lista_plana(ijson.items(f, "item"))
+                return
+
+            agregar = self._agregar_materia
+            crear = self._materia_desde_json
+            # kvitems entrega cada par (semestre, materias) a medida que lo va leyendo
+            for semestre, materias in ijson.kvitems(f, ""):
+                for codigo, materia in materias.items():
+                    agregar(crear(codigo, materia))
+
+    def _ordenar_por_previas(self):
+        """
+        Método privado que calcula, una sola vez al cargar el plan, un orden de las materias
+        en el que cada una aparece después de sus previas (algoritmo de Kahn) y la profundidad
+        de cada materia en la cadena de previas.
+        Las previas que no están en el plan se ignoran; las materias que forman un ciclo de previas
+        quedan fuera del orden.
+        """
+        pendientes_por_codigo = {codigo: 0 for codigo in self._materias_por_codigo} # previas sin ubicar de cada materia
+        habilita = defaultdict(list) # código de la previa -> materias que la requieren
+        for uc in self.materias:
+            for previa in uc.previas:
+                if previa in pendientes_por_codigo:
+                    habilita[previa].append(uc.codigo)
+                    pendientes_por_codigo[uc.codigo] += 1
+
+        disponibles = deque(codigo for codigo, pendientes in pendientes_por_codigo.items() if pendientes == 0)
+        self._orden_topologico = []
+        self._profundidad = {}
+        while disponibles:
+            codigo = disponibles.popleft()
+            self._orden_topologico.append(codigo)
+            previas = self._materias_por_codigo[codigo].previas
+            self._profundidad[codigo] = 1 + max(
+                (self._profundidad[p] for p in previas if p in self._profundidad), default=0
+            )
+            for siguiente in habilita[codigo]:
+                pendientes_por_codigo[siguiente] -= 1
+                if pendientes_por_codigo[siguiente] == 0:
+                    disponibles.append(siguiente)
+
+    def _resolver_previas(self):
+        """
+        Método privado que, una sola vez al cargar el plan, asocia a cada código de previa
+        su UnidadCurricular (o None si la previa no está en el plan), para no buscarlas en cada consulta.
+        También arma la máscara de previas de cada materia: el OR de los bits de sus previas, o None
+        si alguna previa no está en el plan (esas materias se revisan previa por previa).
+        """
+        buscar = self._materias_por_codigo.get
+        self._previas_por_codigo = {
+            uc.codigo: tuple((previa, buscar(previa)) for previa in uc.previas)
+            for uc in self.materias
+        }
+
+        bit_de = self._bit_por_codigo.get
+        self._mascara_previas = {}
+        for uc in self.materias:
+            mascara = 0
+            for previa in uc.previas:
+                bit = bit_de(previa)
+                if bit is None:
+                    mascara = None
+                    break
+                mascara |= bit
+            self._mascara_previas[uc.codigo] = mascara
+
+    def previas_de(self, codigo):
+        """
+        Devuelve las previas de una materia ya resueltas contra el plan.
+
+        Args:
+            codigo (str): Código de la unidad curricular.
+
+        Returns:
+            tuple: Pares (código de la previa, UnidadCurricular o None si la previa no está en el plan).
+                   Vacío si la materia no está en el plan.
+        """
+        return self._previas_por_codigo.get(codigo, ())
+
+    def semestre_sugerido(self, codigo):
+        """
+        Devuelve el semestre más temprano en que puede cursarse una materia, según la cadena de previas
+        (1 si no tiene previas, 2 si sus previas no tienen previas, etc.).
+
+        Args:
+            codigo (str): Código de la unidad curricular.
+
+        Returns:
+            int o None: El semestre sugerido, o None si la materia no está en el plan o forma parte de un ciclo de previas.
+        """
+        return self._profundidad.get(codigo)
 
     def ver(self):
         """
         Imprime en consola la lista completa de materias del plan de estudio.
         Muestra código, nombre, créditos y previas si las hay.
         """
-        print(f"Plan de Estudio: {self.nombre_plan}")
-        print("-" * 40)
+        # Se arman todas las líneas y se escriben de una sola vez en la consola
+        lineas = [f"Plan de Estudio: {self.nombre_plan}", "-" * 40]
         for materia in self.materias:
-            print(f"{materia.codigo} - {materia.nombre} ({materia.creditos} créditos)")
+            lineas.append(f"{materia.codigo} - {materia.nombre} ({materia.creditos} créditos)")
             if materia.previas:
-                print(f"  ↳ Previas: {', '.join(materia.previas)}")
-        print("-" * 40)
+                lineas.append(f"  ↳ Previas: {', '.join(materia.previas)}")
+        lineas.append("-" * 40)
+        sys.stdout.write("\n".join(lineas) + "\n")
 
-class Curso:
+class Curso(PersistibleMixin):
     
     """
     Representa un curso dictado en un año y semestre determinado, asociado a una unidad curricular.
@@ -160,10 +597,12 @@ class Curso:
         nombre_uc (str): Nombre de la unidad curricular.
         año (int): Año en que se dicta el curso (mayor a 2000).
         semestre (int): Semestre en que se dicta el curso (entre 1 y 10).
-        estudiantes (list of Estudiante): Lista de estudiantes inscritos en el curso.
-        archivo_csv (str): Ruta al archivo CSV que contiene la información del curso.
+        estudiantes (dict): Estudiantes inscritos en el curso, indexados por cédula.
+        archivo_csv (str): Ruta absoluta al archivo CSV que contiene la información del curso.
+            El archivo no se escribe al crear el curso, sino con crear_y_persistir o al guardar (ver PersistibleMixin).
         uc (UnidadCurricular): Objeto de unidad curricular vinculada al curso, obtenido del plan.
     """
+    __slots__ = ("uc", "codigo_uc", "nombre_uc", "año", "semestre", "estudiantes", "archivo_csv", "_pendiente")
 
     def __init__(self, codigo_uc, año, semestre, plan: PlanDeEstudio):
         """
@@ -180,6 +619,7 @@ class Curso:
             ValueError: Si el año es inválido, el semestre está fuera de rango,
                         o el código no coincide con el semestre declarado.
         """
+        self._pendiente = False  # Indica si hay inscripciones que todavía no se escribieron en el CSV
         try:
             if not isinstance(codigo_uc, str):
                 raise TypeError("El código de unidad curricular debe ser un string.")
@@ -199,25 +639,22 @@ class Curso:
                 raise ValueError(f"No se encontró la unidad curricular con código {codigo_uc} en el plan de estudios.")
 
             # Verificar que el código coincida con el semestre (por ejemplo: UC3S2 -> semestre 2)
-            match = re.search(r"S(\d+)$", self.uc.codigo)
-            if match:
-                semestre_codificado = int(match.group(1))
-                if semestre != semestre_codificado:
-                    raise ValueError(f"El semestre proporcionado ({semestre}) no coincide con el código ({self.uc.codigo}).")
+            if self.uc.semestre is not None and semestre != self.uc.semestre:
+                raise ValueError(f"El semestre proporcionado ({semestre}) no coincide con el código ({self.uc.codigo}).")
 
             # Atributos principales
             self.codigo_uc = self.uc.codigo
             self.nombre_uc = self.uc.nombre
             self.año = año
             self.semestre = semestre
-            self.estudiantes = []
-            self.archivo_csv = f"curso_{self.codigo_uc}_{self.año}_sem{self.semestre}.csv"
+            self.estudiantes = {}  # Cédula -> Estudiante, para comprobar duplicados sin recorrer los inscritos
+            # Ruta absoluta: el guardado es diferido y no debe depender del directorio actual en ese momento
+            self.archivo_csv = os.path.abspath(f"curso_{self.codigo_uc}_{self.año}_sem{self.semestre}.csv")
 
-            self.generar_csv()
-            print(f"✔ Curso creado para {self.nombre_uc} ({self.codigo_uc}) - {self.año}, Semestre {self.semestre}")
+            log.info("✔ Curso creado para %s (%s) - %s, Semestre %s", self.nombre_uc, self.codigo_uc, self.año, self.semestre)
 
         except (ValueError, TypeError) as e:
-            print(f"✖ Error al crear el curso: {e}")
+            log.error("✖ Error al crear el curso: %s", e)
             self.uc = None  # para impedir operaciones posteriores
 
     def curso_valido(self):
@@ -229,22 +666,49 @@ class Curso:
         """
         return self.uc is not None
 
+    @classmethod
+    def crear_y_persistir(cls, codigo_uc, año, semestre, plan: PlanDeEstudio):
+        """
+        Crea un curso y, si es válido, escribe su archivo CSV en el momento.
+
+        Args:
+            codigo_uc (str): Código de la unidad curricular.
+            año (int): Año del curso (debe ser mayor a 2000).
+            semestre (int): Semestre del curso (entre 1 y 10).
+            plan (PlanDeEstudio): Objeto que contiene todas las unidades curriculares disponibles.
+
+        Returns:
+            Curso: El curso creado (válido o no).
+        """
+        curso = cls(codigo_uc, año, semestre, plan)
+        if curso.curso_valido():
+            curso.generar_csv()
+        return curso
+
     def generar_csv(self):
         """
-        Genera un archivo CSV inicial del curso con los datos principales y encabezados.
+        Genera el archivo CSV del curso con los datos principales y una fila por cada estudiante inscrito.
         """
         try:
-            with open(self.archivo_csv, mode='w', newline='', encoding='utf-8') as archivo:
-                writer = csv.writer(archivo)
-                writer.writerow(["Código UC", "Nombre UC", "Año", "Semestre", "Estudiantes Inscritos"])
-                writer.writerow([self.codigo_uc, self.nombre_uc, self.año, self.semestre, ""])
+            self._escribir_archivo()
         except Exception as e:
-            print(f"✖ Error al generar el archivo CSV: {e}")
+            log.error("✖ Error al generar el archivo CSV: %s", e)
+
+    def _escribir_archivo(self):
+        """Método privado que escribe el archivo CSV del curso, dejando pasar los errores de escritura."""
+        _escribir_csv(
+            self.archivo_csv,
+            "Código UC,Nombre UC,Año,Semestre\r\n"
+            + _fila_csv([self.codigo_uc, self.nombre_uc, self.año, self.semestre])
+            + "Nombre,Apellido,Cédula\r\n",
+            self.estudiantes.values(),
+        )
 
     def agregar_estudiante(self, estudiante):
 
         """
         Agrega un estudiante al curso, si no está ya inscrito.
+        El archivo CSV se actualiza en el próximo guardado.
 
         Args:
             estudiante (Estudiante): Objeto de tipo Estudiante.
@@ -254,52 +718,71 @@ class Curso:
         """
 
         if not self.curso_valido():
-            print("✖ Este curso no es válido. No se puede agregar estudiantes.")
+            log.error("✖ Este curso no es válido. No se puede agregar estudiantes.")
             return
 
-        try:
-            if not isinstance(estudiante, Estudiante):
-                raise TypeError(f"{estudiante} no es un Estudiante")
+        if self._inscribir(estudiante):
+            self._marcar_pendiente()
 
-            if estudiante not in self.estudiantes:
-                self.estudiantes.append(estudiante)
-                self.actualizar_csv()
-                print(f"✔ Estudiante {estudiante.nombre} {estudiante.apellido} agregado al curso.")
-            else:
-                print("⚠ El estudiante ya está inscrito en este curso.")
-        except TypeError as e:
-            print(f"✖ Error al agregar estudiante: {e}")
+    def agregar_estudiantes(self, estudiantes):
+        """
+        Agrega varios estudiantes al curso (por ejemplo, al importar un padrón), omitiendo los que ya están inscritos.
+
+        Args:
+            estudiantes (iterable of Estudiante): Estudiantes a agregar.
+
+        Returns:
+            list of Estudiante: Los estudiantes que quedaron inscritos.
+        """
+        if not self.curso_valido():
+            log.error("✖ Este curso no es válido. No se puede agregar estudiantes.")
+            return []
+
+        with salida_agrupada():
+            nuevos = [estudiante for estudiante in estudiantes if self._inscribir(estudiante)]
+        if nuevos:
+            self._marcar_pendiente()
+        return nuevos
 
-    def actualizar_csv(self):
+    def _inscribir(self, estudiante):
         """
-        Actualiza el archivo CSV con la lista actualizada de estudiantes inscritos.
+        Método privado que registra a un estudiante en el curso, sin escribir el archivo CSV.
+
+        Args:
+            estudiante (Estudiante): Objeto de tipo Estudiante.
 
+        Returns:
+            bool: True si el estudiante quedó inscrito, False si ya lo estaba o no es un Estudiante.
         """
         try:
-            with open(self.archivo_csv, mode='w', newline='', encoding='utf-8') as archivo:
-                writer = csv.writer(archivo)
-                writer.writerow(["Código UC", "Nombre UC", "Año", "Semestre", "Estudiantes Inscritos"])
-                nombres_estudiantes = [f"{e.nombre} {e.apellido}" for e in self.estudiantes]
-                writer.writerow([self.codigo_uc, self.nombre_uc, self.año, self.semestre, ', '.join(nombres_estudiantes)])
-        except Exception as e:
-            print(f"✖ Error al actualizar el CSV: {e}")
+            if not isinstance(estudiante, Estudiante):
+                raise TypeError(f"{estudiante} no es un Estudiante")
+
+            if estudiante.cedula not in self.estudiantes:
+                self.estudiantes[estudiante.cedula] = estudiante
+                log.info("✔ Estudiante %s agregado al curso.", estudiante.nombre_completo())
+                return True
+            log.warning("⚠ El estudiante ya está inscrito en este curso.")
+        except TypeError as e:
+            log.error("✖ Error al agregar estudiante: %s", e)
+        return False
 
     def mostrar_estudiantes(self):
         """
         Muestra los estudiantes inscritos en el curso por consola.
         """
         if not self.curso_valido():
-            print("✖ Este curso no es válido. No hay estudiantes que mostrar.")
+            log.error("✖ Este curso no es válido. No hay estudiantes que mostrar.")
             return
 
         if not self.estudiantes:
             print("No hay estudiantes inscritos en este curso.")
         else:
             print(f"Estudiantes inscritos en {self.nombre_uc}:")
-            for e in self.estudiantes:
-                print(f"- {e.nombre} {e.apellido}")
+            for e in self.estudiantes.values():
+                print(f"- {e.nombre_completo()}")
 
-class InstanciaDeExamen:
+class InstanciaDeExamen(PersistibleMixin):
     """
     Representa una instancia de examen para una unidad curricular específica en una fecha y hora determinadas.
 
@@ -307,8 +790,11 @@ class InstanciaDeExamen:
         codigo_uc (str): Código de la unidad curricular del examen.
         fecha (str): Fecha en formato 'YYYY-MM-DD'.
         hora (str): Hora en formato 'HH:MM'.
-        estudiantes (list of Estudiante): Lista de estudiantes inscritos en el examen.
+        estudiantes (dict): Estudiantes inscritos en el examen, indexados por cédula.
+        archivo_csv (str): Ruta absoluta al archivo CSV con los inscritos al examen.
     """
+    __slots__ = ("codigo_uc", "fecha", "hora", "estudiantes", "archivo_csv", "_pendiente")
+
     def __init__(self, codigo_uc, fecha, hora):
         """
         Inicializa una nueva instancia del examen con su código UC, fecha y hora.
@@ -321,28 +807,36 @@ class InstanciaDeExamen:
         self.codigo_uc = codigo_uc
         self.fecha = fecha
         self.hora = hora
-        self.estudiantes = []  # Lista para almacenar instancias de estudiantes
+        self.estudiantes = {}  # Cédula -> Estudiante, para comprobar duplicados sin recorrer los inscritos
+        # Crear el nombre del archivo basado en el código de la UC y la fecha (como ruta absoluta,
+        # así el guardado diferido escribe en el directorio de creación aunque después cambie)
+        self.archivo_csv = os.path.abspath(f"examen_{self.codigo_uc}_{self.fecha}.csv")
+        self._pendiente = False  # Indica si hay inscripciones que todavía no se escribieron en el CSV
 
         self.generar_csv()
+        log.info("Examen para UC %s creado en el archivo %s con éxito.", self.codigo_uc, os.path.basename(self.archivo_csv))
 
     def generar_csv(self):
         """
-        Genera un archivo CSV con la información de la instancia del examen, incluyendo los estudiantes inscritos.
+        Genera un archivo CSV con la información de la instancia del examen y una fila por cada estudiante inscrito.
         El archivo se crea con nombre 'examen_<codigo_uc>_<fecha>.csv'.
         """
-        # Crear el nombre del archivo basado en el código de la UC y la fecha
-        archivo_csv = f"examen_{self.codigo_uc}_{self.fecha}.csv"
         # Convertir la fecha y hora en un formato adecuado
         fecha_hora = f"{self.fecha} {self.hora}" 
         
-        # Crear o sobrescribir el archivo CSV con la información de la instancia de examen
-        with open(archivo_csv, mode='w', newline='') as file: # Abre (o crea) el archivo CSV en modo escritura ('w'), sin agregar líneas nuevas adicionales (newline='')
-            writer = csv.writer(file)   # Crea un escritor CSV que escribirá en el archivo abierto
-            # Escribe la primera fila del archivo con los nombres de las columnas
-            writer.writerow(["Código UC", "Fecha y Hora", "Estudiantes Inscritos"])
-            writer.writerow([self.codigo_uc, fecha_hora, ', '.join([str(estudiante) for estudiante in self.estudiantes])]) # para cada estudiante en la lista de estudiantes, paso estudiante a str y une cada estudiante a una cadena de texto separada con ,
-        
-        print(f"Examen para UC {self.codigo_uc} creado en el archivo {archivo_csv} con éxito.")
+        # Crear o sobrescribir el archivo CSV con la información de la instancia de examen:
+        # la fila con los nombres de las columnas, la fila con los datos, el encabezado de la lista de estudiantes y sus filas
+        _escribir_csv(
+            self.archivo_csv,
+            "Código UC,Fecha y Hora\r\n"
+            + _fila_csv([self.codigo_uc, fecha_hora])
+            + "Nombre,Apellido,Cédula\r\n",
+            self.estudiantes.values(),
+        )
+
+    def _escribir_archivo(self):
+        """Método privado que escribe el archivo CSV del examen; generar_csv ya deja pasar los errores de escritura."""
+        self.generar_csv()
 
     def agregar_estudiante(self, estudiante):
         """
@@ -356,46 +850,55 @@ class InstanciaDeExamen:
             - Verifica que el estudiante esté regular en la UC del examen.
             - Verifica que el estudiante no esté ya inscripto.
 
-        Actualiza el archivo CSV al agregar exitosamente un estudiante.
+        Si el estudiante queda inscrito, el archivo CSV se actualiza en el próximo guardado.
+        """
+        if self._inscribir(estudiante):
+            self._marcar_pendiente()
+
+    def agregar_estudiantes(self, estudiantes):
+        """
+        Inscribe a varios estudiantes en la instancia del examen, con las mismas validaciones que agregar_estudiante.
+
+        Args:
+            estudiantes (iterable of Estudiante): Estudiantes a inscribir.
+
+        Returns:
+            list of Estudiante: Los estudiantes que quedaron inscritos.
+        """
+        with salida_agrupada():
+            nuevos = [estudiante for estudiante in estudiantes if self._inscribir(estudiante)]
+        if nuevos:
+            self._marcar_pendiente()
+        return nuevos
+
+    def _inscribir(self, estudiante):
+        """
+        Método privado que registra a un estudiante en el examen si cumple las validaciones, sin escribir el archivo CSV.
+
+        Args:
+            estudiante (Estudiante): Objeto estudiante a inscribir.
+
+        Returns:
+            bool: True si el estudiante quedó inscrito, False en caso contrario.
         """
         # Verificar si el objeto es una instancia válida de la clase Estudiante
         if isinstance(estudiante, Estudiante): #Primero verifico que el estudiante sea un objeto estudiante
             # Verificar si el estudiante está regular en la UC correspondiente
-            uc_en_registro = None 
-            for uc in estudiante.ucs_regulares: #para cada uc en las ucs en las que el estudiante esta regular
-                if uc.codigo == self.codigo_uc: #si el codigo de la uc es igual al codigo de la uc que se hace el examen
-                    uc_en_registro = uc #asigno la uc
-                    break
+            uc_en_registro = estudiante.ucs_regulares.get(self.codigo_uc) #la uc del examen entre las regulares del estudiante, o None
 
             if uc_en_registro: #si uc en registro no es None
                 # Verificar si el estudiante ya está inscrito en el examen
-                if estudiante not in self.estudiantes: #y el estudiante no esta en la lista de estudiantes inscriptos al examen
-                    self.estudiantes.append(estudiante) #lo agrego
-                    self.actualizar_csv()  # Actualizar el CSV con la lista de estudiantes
-                    print(f"Estudiante {estudiante.nombre} {estudiante.apellido} inscrito al examen de {uc_en_registro.nombre} con éxito.")
+                if estudiante.cedula not in self.estudiantes: #y el estudiante no esta entre los inscriptos al examen
+                    self.estudiantes[estudiante.cedula] = estudiante #lo agrego
+                    log.info("Estudiante %s inscrito al examen de %s con éxito.", estudiante.nombre_completo(), uc_en_registro.nombre)
+                    return True
                 else: #si ya estaba inscripto
-                    print(f"El estudiante {estudiante.nombre} {estudiante.apellido} ya está inscrito en el examen.")
+                    log.warning("El estudiante %s ya está inscrito en el examen.", estudiante.nombre_completo())
             else: #si no estaba regular
-                print(f"El estudiante {estudiante.nombre} {estudiante.apellido} no está regular en la UC {self.codigo_uc}. No puede inscribirse al examen.")
+                log.warning("El estudiante %s no está regular en la UC %s. No puede inscribirse al examen.", estudiante.nombre_completo(), self.codigo_uc)
         else:
-            print("El objeto proporcionado no es una instancia válida de la clase Estudiante.") #si no es objeto estudiante 
-
-    def actualizar_csv(self): #esto cada vez q un estudiante nuevo se inscribe 
-        """
-        Actualiza el archivo CSV de la instancia de examen con la lista actual de estudiantes inscritos.
-        """
-        # Crear el nombre del archivo basado en el código de la UC y la fecha
-        archivo_csv = f"examen_{self.codigo_uc}_{self.fecha}.csv" #el nombre del archivo
-        # Convertir la fecha y hora en un formato adecuado
-        fecha_hora = f"{self.fecha} {self.hora}"
-        
-        # Sobrescribir el archivo CSV con la lista actualizada de estudiantes inscritos
-        with open(archivo_csv, mode='w', newline='') as file:
-            writer = csv.writer(file)
-            writer.writerow(["Código UC", "Fecha y Hora", "Estudiantes Inscritos"])
-            writer.writerow([self.codigo_uc, fecha_hora, ', '.join([str(estudiante) for estudiante in self.estudiantes])])
-        
-        print(f"Archivo CSV actualizado con los estudiantes inscritos en {archivo_csv}.")
+            log.error("El objeto proporcionado no es una instancia válida de la clase Estudiante.") #si no es objeto estudiante 
+        return False
 
     def mostrar_estudiantes(self):
         """
@@ -406,7 +909,7 @@ class InstanciaDeExamen:
             print("No hay estudiantes inscritos en este examen.")
         else:
             print("Estudiantes inscritos:")
-            for estudiante in self.estudiantes:
+            for estudiante in self.estudiantes.values():
                 print(estudiante)
 
 class Estudiante(Persona):
@@ -414,48 +917,79 @@ class Estudiante(Persona):
     Representa a un estudiante, heredando de la clase Persona.
 
     Atributos:
-        _cedula (str): Cédula de identidad del estudiante.
+        cedula (int): Cédula de identidad del estudiante (solo lectura: identifica al estudiante en sets y dicts).
         año_ingreso (int): Año en que ingresó a la carrera.
-        plan (PlanDeEstudio): Plan de estudios asociado.
-        ucs_aprobadas (list): Lista de unidades curriculares aprobadas.
-        ucs_regulares (list): Lista de unidades curriculares regulares.
-        ucs_a_examen (list): Lista de unidades curriculares para las que se ha inscripto a examen.
-        ucs_cursando (list): Lista de unidades curriculares que está cursando actualmente.
+        plan (PlanDeEstudio): Plan de estudios asociado (solo lectura: los bits de la máscara de aprobadas dependen de él).
+        ucs_aprobadas (Mapping): Unidades curriculares aprobadas, indexadas por código (solo lectura;
+            se modifican a través de la Coordinadora o la Secretaria).
+        ucs_regulares (dict): Unidades curriculares regulares, indexadas por código.
+        ucs_a_examen (dict): Unidades curriculares para las que se ha inscripto a examen, indexadas por código.
+        ucs_cursando (dict): Unidades curriculares que está cursando actualmente, indexadas por código.
     """
-    def __init__(self, nombre, apellido, cedula, año_ingreso, plan: PlanDeEstudio):
+    __slots__ = (
+        "_cedula", "año_ingreso", "_plan", "_ucs_aprobadas", "_vista_aprobadas", "ucs_regulares", "ucs_a_examen", "ucs_cursando",
+        "_mascara_aprobadas",
+    )
+
+    def __init__(self, nombre, apellido, cedula, año_ingreso, plan: PlanDeEstudio, validar=True):
         """
         Inicializa una instancia de Estudiante.
 
         Args:
             nombre (str): Nombre del estudiante.
             apellido (str): Apellido del estudiante.
-            cedula (str): Cédula de identidad.
+            cedula (int o str): Cédula de identidad (se guarda como entero).
             año_ingreso (int): Año de ingreso.
             plan (PlanDeEstudio): Plan de estudio que cursa el estudiante.
+            validar (bool): Si es False se omiten las validaciones (para datos ya validados). La cédula
+                se convierte a entero de todos modos.
 
         Raises:
             ValueError: Si la cédula no es un número entero válido.
         """
-        super().__init__(nombre, apellido)
-        self._cedula=cedula
-        try:
-            cedula = int(cedula)
-        except (ValueError, TypeError):
+        super().__init__(nombre, apellido, validar)
+        if validar and not _es_cedula_valida(cedula):
             raise ValueError("La cédula debe ser un número entero válido.")
+        # Se guarda como entero también sin validar, así 123, "123" y " 123 " son la misma cédula al comparar estudiantes
+        self._cedula = int(cedula)
         self.año_ingreso = año_ingreso
-        self.plan = plan
-        self.ucs_aprobadas = []
-        self.ucs_regulares = []
-        self.ucs_a_examen = []
-        self.ucs_cursando = []
+        self._plan = plan
+        # Registros código -> UnidadCurricular (conservan el orden en que se agregaron las UCs)
+        self._ucs_aprobadas = {}
+        self._vista_aprobadas = MappingProxyType(self._ucs_aprobadas)  # Solo lectura: la máscara de aprobadas depende de este registro
+        self.ucs_regulares = {}
+        self.ucs_a_examen = {}
+        self.ucs_cursando = {}
+        self._mascara_aprobadas = 0  # OR de los bits (según el plan) de las UCs aprobadas
+
     @property
     def cedula(self):
         """Devuelve la cédula del estudiante."""
         return self._cedula
-    
+
+    @property
+    def plan(self):
+        """Devuelve el plan de estudio del estudiante."""
+        return self._plan
+
+    @property
+    def ucs_aprobadas(self):
+        """Vista de solo lectura de las UCs aprobadas, para que solo _agregar_aprobada y _quitar_aprobada las modifiquen."""
+        return self._vista_aprobadas
+
     def __str__(self):
         """Representación textual del estudiante."""
-        return f"{self.nombre} {self.apellido} {self.cedula}"
+        return f"{self.nombre} {self.apellido} {self._cedula}"
+
+    def __eq__(self, otro):
+        """Dos estudiantes son iguales si tienen la misma cédula."""
+        if not isinstance(otro, Estudiante):
+            return NotImplemented
+        return self._cedula == otro._cedula
+
+    def __hash__(self):
+        """El hash depende solo de la cédula, así los duplicados se detectan en sets y dicts."""
+        return hash(self._cedula)
     
     def ver_ucs_aprobadas(self): 
         """Imprime por pantalla las unidades curriculares aprobadas."""
@@ -463,7 +997,7 @@ class Estudiante(Persona):
             print("No tenés UCs aprobadas.")
         else:
             print("UCs aprobadas:")
-            for uc in self.ucs_aprobadas: #para cada uc en la lista
+            for uc in self.ucs_aprobadas.values(): #para cada uc registrada
                 print(f"- {uc.codigo}: {uc.nombre}") #como es una uc puedo usar los atributos de la clas uc
     
     def ver_ucs_regulares(self):
@@ -472,7 +1006,7 @@ class Estudiante(Persona):
             print("No estás regular en ninguna UC.")
         else:
             print("UCs regulares:")
-            for uc in self.ucs_regulares:
+            for uc in self.ucs_regulares.values():
                 print(f"- {uc.codigo}: {uc.nombre}")
     
     def ver_ucs_cursando(self):
@@ -481,7 +1015,7 @@ class Estudiante(Persona):
             print("No estás cursando ninguna UC.")
         else:
             print("UCs que estás cursando:")
-            for uc in self.ucs_cursando:
+            for uc in self.ucs_cursando.values():
                 print(f"- {uc.codigo}: {uc.nombre}")
     
     def _puede_inscribirse(self, codigo_uc):
@@ -494,27 +1028,30 @@ class Estudiante(Persona):
         Returns:
             bool: True si puede inscribirse, False en caso contrario.
         """
-        uc = self.plan.buscar_uc_por_codigo(codigo_uc) #obtengo la uc a partir del codigo de la uc
-        codigos_aprobadas = [u.codigo for u in self.ucs_aprobadas] #guardo en una lista los codigos de las uc que el alumno tiene aprobadas
-        codigos_cursando = [u.codigo for u in self.ucs_cursando] #guardo en una lista los codigos de las uc que el alumno esta cursando
-        previas_faltantes = [] 
-        for previa_codigo in uc.previas: #para cada codigo de previa en la lista de previas de la uc
-            previa = self.plan.buscar_uc_por_codigo(previa_codigo) #obtengo la uc previa a partir del codigo
-            if previa.codigo not in codigos_aprobadas: #si el codigo de la previa no esta en las materias aprobadas del paciente
-                previas_faltantes.append(previa) #guardo esa previa en la lista
-        
-        if previas_faltantes: #en la lista de previas que el alumno no tiene
-            print(f"No puedes inscribirte en la UC {uc.nombre} porque te faltan las siguientes previas:")
-            for previa in previas_faltantes:
-                print(f"- {previa.nombre}") #imprimo el nombre de cada previa que imposibilita al alumno cursar la uc
-            return False #retorno falso para poder usar este metodo en otros metodos
+        plan = self._plan
+        uc = plan.buscar_uc_por_codigo(codigo_uc) #obtengo la uc a partir del codigo de la uc
+        codigos_aprobadas = self._ucs_aprobadas #codigos de las uc que el alumno tiene aprobadas
+        codigos_cursando = self.ucs_cursando #codigos de las uc que el alumno esta cursando
+
+        # Camino rápido: si todas las previas están en el plan, alcanza con comparar la máscara de previas
+        # con la de aprobadas (un AND entre enteros). Solo si falta alguna se arma la lista para el mensaje
+        mascara_previas = plan._mascara_previas.get(uc.codigo)
+        if mascara_previas is None or mascara_previas & ~self._mascara_aprobadas:
+            previas = plan.previas_de(uc.codigo) #pares (codigo, uc) de las previas, resueltos al cargar el plan
+            previas_faltantes = [(codigo, previa) for codigo, previa in previas if codigo not in codigos_aprobadas] #previas que el alumno no aprobo
+
+            if previas_faltantes: #en la lista de previas que el alumno no tiene
+                if log.isEnabledFor(logging.WARNING): #solo armo el detalle si el mensaje se va a mostrar
+                    detalle = "\n".join(f"- {previa.nombre if previa else previa_codigo}" for previa_codigo, previa in previas_faltantes) #nombre de cada previa que imposibilita al alumno cursar la uc
+                    log.warning("No puedes inscribirte en la UC %s porque te faltan las siguientes previas:\n%s", uc.nombre, detalle)
+                return False #retorno falso para poder usar este metodo en otros metodos
         
         if uc.codigo in codigos_cursando: #si el codigo de la uc que el alumno quiere cursar esta dentro de las materias que esta cursando
-            print("Ya está cursando esta UC.")
+            log.warning("Ya está cursando esta UC.")
             return False
         
         if uc.codigo in codigos_aprobadas: #si el codigo de la uc que el alumno quiere cursar esta dentro de las materias que ya aprobo
-            print("Ya aprobó esta UC.")
+            log.warning("Ya aprobó esta UC.")
             return False
         return True
     
@@ -527,18 +1064,17 @@ class Estudiante(Persona):
         """
         if isinstance(instancia_examen, InstanciaDeExamen): #si el examen al q se quiere inscribir es un objeto de instancia de examen
             codigo_uc = instancia_examen.codigo_uc #esta es la uc al que el alumno se quiere inscribir al examen
-            for uc in self.ucs_regulares: #para las uc dentro de las ucs que el alumno tiene regulares
-                if uc.codigo == codigo_uc: #si el codigo de esa uc es igual al codigo de la uc a examen
-                    instancia_examen.agregar_estudiante(self) #inscribo al estudiante al examen
-                    print(f"Estas inscripto al examen de {uc.nombre}")
-                    return
-            for uc in self.ucs_aprobadas:
-                if uc.codigo ==codigo_uc:
-                    print("Esa materia ya la aprobaste naboleti")
-                    return
-            print(f"No cumple con los requisitos para inscribirse a {codigo_uc}")
+            uc = self.ucs_regulares.get(codigo_uc) #si el alumno tiene regular la uc a examen
+            if uc is not None:
+                instancia_examen.agregar_estudiante(self) #inscribo al estudiante al examen
+                log.info("Estas inscripto al examen de %s", uc.nombre)
+                return
+            if codigo_uc in self.ucs_aprobadas:
+                log.warning("Esa materia ya la aprobaste naboleti")
+                return
+            log.warning("No cumple con los requisitos para inscribirse a %s", codigo_uc)
         else:
-            print("Instancia de examen no válida.")
+            log.error("Instancia de examen no válida.")
     
     def inscribirse_a_curso(self, curso: Curso):
         """
@@ -548,17 +1084,212 @@ class Estudiante(Persona):
             curso (Curso): Curso al que desea inscribirse.
         """
         if not curso.curso_valido():
-            print("Curso no válido.")
+            log.error("Curso no válido.")
             return
         if self._puede_inscribirse(curso.codigo_uc):
-            self.ucs_cursando.append(curso.uc)
+            self._agregar_cursando(curso.uc)
             curso.agregar_estudiante(self)  
     
     def ver_plan(self):
         """Muestra el plan de estudio del estudiante."""
         self.plan.ver()
 
-class Coordinadora(Persona):
+    # Métodos privados que modifican los registros de UCs del estudiante
+
+    def _agregar_aprobada(self, uc):
+        """Agrega la UC a las aprobadas. Devuelve False si ya estaba."""
+        if uc.codigo in self._ucs_aprobadas:
+            return False
+        self._ucs_aprobadas[uc.codigo] = uc
+        self._mascara_aprobadas |= self._plan._bit_por_codigo.get(uc.codigo, 0)
+        return True
+
+    def _quitar_aprobada(self, codigo):
+        """Quita de las aprobadas la UC con ese código, buscándola y quitándola en un solo paso. Devuelve la UC quitada, o None si no estaba."""
+        uc = self._ucs_aprobadas.pop(codigo, None)
+        if uc is not None:
+            self._mascara_aprobadas &= ~self._plan._bit_por_codigo.get(codigo, 0)
+        return uc
+
+    def _agregar_regular(self, uc):
+        """Agrega la UC a las regulares. Devuelve False si ya estaba."""
+        if uc.codigo in self.ucs_regulares:
+            return False
+        self.ucs_regulares[uc.codigo] = uc
+        return True
+
+    def _quitar_regular(self, codigo):
+        """Quita de las regulares la UC con ese código, buscándola y quitándola en un solo paso. Devuelve la UC quitada, o None si no estaba."""
+        return self.ucs_regulares.pop(codigo, None)
+
+    def _agregar_cursando(self, uc):
+        """Agrega la UC a las que está cursando. Devuelve False si ya estaba."""
+        if uc.codigo in self.ucs_cursando:
+            return False
+        self.ucs_cursando[uc.codigo] = uc
+        return True
+
+class Resultado(IntEnum):
+    """
+    Resultado de las operaciones que modifican las UCs aprobadas o regulares de un estudiante.
+
+    Valores:
+        OK: El cambio se realizó.
+        SIN_CAMBIOS: No había nada que hacer (la UC ya estaba al agregarla, o no estaba al quitarla).
+        NO_ENCONTRADO: La unidad curricular no existe en el plan del estudiante.
+    """
+    OK = 0
+    SIN_CAMBIOS = 1
+    NO_ENCONTRADO = 2
+
+
+class _GestionDeUCs:
+    """
+    Métodos compartidos por Coordinadora y Secretaria para modificar las UCs aprobadas y regulares
+    de un estudiante. Cada operación busca la UC y modifica el registro del estudiante en un solo paso.
+    """
+    __slots__ = ()
+
+    def quitar_uc_regular(self, estudiante, codigo_uc, informar=True):
+        """
+        Elimina una unidad curricular de las regulares de un estudiante.
+
+        Args:
+            estudiante (Estudiante): Estudiante al que se le eliminará la UC regular.
+            codigo_uc (str o UnidadCurricular): Código de la unidad curricular a eliminar (o la propia unidad curricular).
+            informar (bool): Si es False no se muestra ningún mensaje (pensado para cargas masivas).
+
+        Returns:
+            Resultado: OK si se quitó, SIN_CAMBIOS si no estaba regular, NO_ENCONTRADO si la UC no existe en el plan.
+        """
+        return self._quitar_uc(
+            estudiante, codigo_uc, estudiante._quitar_regular, informar,
+            "✔ %(uc)s fue removida de las UCs regulares de %(estudiante)s.",
+            "✖ %(uc)s no está en las UCs regulares de %(estudiante)s.",
+        )
+
+    def quitar_uc_aprobada(self, estudiante, codigo_uc, informar=True):
+        """
+        Elimina una unidad curricular de las aprobadas de un estudiante.
+
+        Args:
+            estudiante (Estudiante): Estudiante al que se le eliminará la UC aprobada.
+            codigo_uc (str o UnidadCurricular): Código de la unidad curricular a eliminar (o la propia unidad curricular).
+            informar (bool): Si es False no se muestra ningún mensaje (pensado para cargas masivas).
+
+        Returns:
+            Resultado: OK si se quitó, SIN_CAMBIOS si no estaba aprobada, NO_ENCONTRADO si la UC no existe en el plan.
+        """
+        return self._quitar_uc(
+            estudiante, codigo_uc, estudiante._quitar_aprobada, informar,
+            "✔ %(uc)s fue removida de las UCs aprobadas de %(estudiante)s.",
+            "✖ %(uc)s no está en las UCs aprobadas de %(estudiante)s.",
+        )
+
+    def agregar_uc_aprobada(self, estudiante, codigo_uc, informar=True):
+        """
+        Añade una unidad curricular aprobada a un estudiante.
+
+        Args:
+            estudiante (Estudiante): Estudiante al que se le agregará la UC aprobada.
+            codigo_uc (str o UnidadCurricular): Código de la unidad curricular aprobada (o la propia unidad curricular).
+            informar (bool): Si es False no se muestra ningún mensaje (pensado para cargas masivas).
+
+        Returns:
+            Resultado: OK si se agregó, SIN_CAMBIOS si ya estaba aprobada, NO_ENCONTRADO si la UC no existe en el plan.
+        """
+        return self._agregar_uc(
+            estudiante, codigo_uc, estudiante._agregar_aprobada, informar,
+            "✔ %(uc)s fue agregada correctamente a las UCs aprobadas de %(estudiante)s.",
+            "✖ %(estudiante)s ya había aprobado la UC %(uc)s.",
+        )
+
+    def agregar_uc_regular(self, estudiante, codigo_uc, informar=True):
+        """
+        Añade una unidad curricular regular a un estudiante.
+
+        Args:
+            estudiante (Estudiante): Estudiante al que se le agregará la UC regular.
+            codigo_uc (str o UnidadCurricular): Código de la unidad curricular regular (o la propia unidad curricular).
+            informar (bool): Si es False no se muestra ningún mensaje (pensado para cargas masivas).
+
+        Returns:
+            Resultado: OK si se agregó, SIN_CAMBIOS si ya estaba regular, NO_ENCONTRADO si la UC no existe en el plan.
+        """
+        return self._agregar_uc(
+            estudiante, codigo_uc, estudiante._agregar_regular, informar,
+            "✔ %(uc)s fue agregada correctamente a las UCs regulares de %(estudiante)s.",
+            "✖ %(estudiante)s ya estaba regular en la UC %(uc)s.",
+        )
+
+    @staticmethod
+    def _agregar_uc(estudiante, codigo_uc, agregar, informar, mensaje_ok, mensaje_sin_cambios):
+        """
+        Método privado que obtiene la UC (el propio objeto, o la del plan con ese código) y la agrega
+        con el método indicado del estudiante.
+
+        Args:
+            estudiante (Estudiante): Estudiante a modificar.
+            codigo_uc (str o UnidadCurricular): La unidad curricular o su código.
+            agregar (callable): Método del estudiante que agrega la UC y devuelve False si ya estaba.
+            informar (bool): Si es False no se registra ningún mensaje.
+            mensaje_ok (str): Mensaje si se agregó, con los campos %(uc)s y %(estudiante)s.
+            mensaje_sin_cambios (str): Mensaje si ya estaba, con los mismos campos.
+
+        Returns:
+            Resultado: El resultado de la operación.
+        """
+        if isinstance(codigo_uc, UnidadCurricular):
+            uc = codigo_uc
+        else:
+            uc = estudiante.plan.buscar_uc_por_codigo(codigo_uc)
+            if uc is None:
+                if informar:
+                    log.error("✖ No se encontró la unidad curricular %s en el plan.", codigo_uc)
+                return Resultado.NO_ENCONTRADO
+
+        if agregar(uc):
+            if informar:
+                log.info(mensaje_ok, {"uc": uc.nombre, "estudiante": estudiante.nombre})
+            return Resultado.OK
+        if informar:
+            log.warning(mensaje_sin_cambios, {"uc": uc.nombre, "estudiante": estudiante.nombre})
+        return Resultado.SIN_CAMBIOS
+
+    @staticmethod
+    def _quitar_uc(estudiante, codigo_uc, quitar, informar, mensaje_ok, mensaje_sin_cambios):
+        """
+        Método privado que quita la UC del registro del estudiante directamente por su código.
+        El plan solo se consulta si la UC no estaba, para distinguir una UC inexistente y armar el mensaje.
+
+        Args:
+            estudiante (Estudiante): Estudiante a modificar.
+            codigo_uc (str o UnidadCurricular): La unidad curricular o su código.
+            quitar (callable): Método del estudiante que quita la UC por código y la devuelve (o None si no estaba).
+            informar (bool): Si es False no se registra ningún mensaje.
+            mensaje_ok (str): Mensaje si se quitó, con los campos %(uc)s y %(estudiante)s.
+            mensaje_sin_cambios (str): Mensaje si no estaba, con los mismos campos.
+
+        Returns:
+            Resultado: El resultado de la operación.
+        """
+        es_uc = isinstance(codigo_uc, UnidadCurricular)
+        uc = quitar(codigo_uc.codigo if es_uc else codigo_uc)
+        if uc is not None:
+            if informar:
+                log.info(mensaje_ok, {"uc": uc.nombre, "estudiante": estudiante.nombre})
+            return Resultado.OK
+
+        uc = codigo_uc if es_uc else estudiante.plan.buscar_uc_por_codigo(codigo_uc)
+        if uc is None:
+            if informar:
+                log.error("✖ No se encontró la unidad curricular %s en el plan.", codigo_uc)
+            return Resultado.NO_ENCONTRADO
+        if informar:
+            log.warning(mensaje_sin_cambios, {"uc": uc.nombre, "estudiante": estudiante.nombre})
+        return Resultado.SIN_CAMBIOS
+
+class Coordinadora(_GestionDeUCs, Persona):
     """
     Representa a una persona que cumple el rol de coordinadora académica, 
     encargada de gestionar planes de estudio, cursos y exámenes.
@@ -567,6 +1298,8 @@ class Coordinadora(Persona):
         - nombre (str): Nombre de la persona.
         - apellido (str): Apellido de la persona.
     """
+    __slots__ = ()  # Sin atributos propios: solo los de Persona
+
     def __init__(self, nombre, apellido):
         """
         Inicializa una instancia de la clase Coordinadora.
@@ -577,6 +1310,22 @@ class Coordinadora(Persona):
         """
         super().__init__(nombre, apellido)
 
+    def __enter__(self):
+        """
+        Permite usar a la coordinadora en un bloque with. Al salir del bloque se llama a guardar_pendientes(),
+        que escribe los archivos CSV de todos los cursos y exámenes con cambios sin guardar, incluidos
+        los modificados fuera del bloque o por otra coordinadora.
+
+        Returns:
+            Coordinadora: La propia coordinadora.
+        """
+        return self
+
+    def __exit__(self, tipo_error, error, traza):
+        """Guarda todos los archivos CSV pendientes (no solo los del bloque) al salir del bloque with, aunque haya ocurrido un error."""
+        guardar_pendientes()
+        return False
+
     def crear_plan(self, nombre_plan, ruta_json):
         """
         Crea un nuevo plan de estudio con el nombre y la ruta especificados.
@@ -589,7 +1338,7 @@ class Coordinadora(Persona):
             PlanDeEstudio: Un objeto PlanDeEstudio creado.
         """
         plan = PlanDeEstudio(nombre_plan, ruta_json)
-        print(f"{self.nombre} ha creado el plan '{nombre_plan}'.")
+        log.info("%s ha creado el plan '%s'.", self.nombre, nombre_plan)
         return plan
         
     def inscribir_a_examen(self, estudiante, examen):
@@ -601,13 +1350,13 @@ class Coordinadora(Persona):
             examen (InstanciaDeExamen): Examen al que desea inscribirse.
         """
         if isinstance(estudiante, Estudiante):
-            uc = estudiante.plan.buscar_uc_por_codigo(examen.codigo_uc)
-            if uc and uc in estudiante.ucs_regulares:
+            codigo_uc, regulares = examen.codigo_uc, estudiante.ucs_regulares #se leen una sola vez
+            if codigo_uc in regulares: #se consulta el registro del estudiante, sin pasar por el plan
                 estudiante.inscribirse_a_examen(examen)
             else:
-                print(f"{estudiante.nombre} no está regular en la UC {uc.codigo}, no puede inscribirse al examen.")
+                log.warning("%s no está regular en la UC %s, no puede inscribirse al examen.", estudiante.nombre, codigo_uc)
         else:
-            print("No existe estudiante.")
+            log.error("No existe estudiante.")
 
         
     def inscribir_a_curso(self, estudiante, curso):
@@ -619,18 +1368,19 @@ class Coordinadora(Persona):
             curso (Curso): Curso al que desea inscribirse.
         """
         if not isinstance(estudiante, Estudiante):
-            print("El objeto proporcionado no es un Estudiante.")
+            log.error("El objeto proporcionado no es un Estudiante.")
             return
 
         if not isinstance(curso, Curso) or not curso.curso_valido():
-            print("El curso no es válido.")
+            log.error("El curso no es válido.")
             return
 
-        if estudiante._puede_inscribirse(curso.codigo_uc):
-            estudiante.ucs_cursando.append(curso.uc)
+        codigo_uc, uc = curso.codigo_uc, curso.uc #se leen una sola vez del curso
+        if estudiante._puede_inscribirse(codigo_uc):
+            estudiante._agregar_cursando(uc)
             curso.agregar_estudiante(estudiante)
         else:
-            print(f"{estudiante.nombre} no puede inscribirse al curso {curso.codigo_uc}")
+            log.warning("%s no puede inscribirse al curso %s", estudiante.nombre, codigo_uc)
 
     def ver_plan(self, plan):
         """
@@ -658,67 +1408,6 @@ class Coordinadora(Persona):
             examen (InstanciaDeExamen): Examen del que se desea ver los estudiantes inscritos.
         """
         examen.mostrar_estudiantes()
-    
-    def quitar_uc_regular(self, estudiante, codigo_uc):
-        """
-        Elimina una unidad curricular de las regulares de un estudiante.
-
-        Args:
-            estudiante (Estudiante): Estudiante al que se le eliminará la UC regular.
-            codigo_uc (str): Código de la unidad curricular a eliminar.
-        """
-        uc = estudiante.plan.buscar_uc_por_codigo(codigo_uc)
-        if uc in estudiante.ucs_regulares:
-            estudiante.ucs_regulares.remove(uc)
-            print(f"✔ {uc.nombre} fue removida de las UCs regulares de {estudiante.nombre}.")
-        else:
-            print(f"✖ {uc.nombre} no está en las UCs regulares de {estudiante.nombre}.")
-    
-    def quitar_uc_aprobada(self, estudiante, codigo_uc):
-        """
-        Elimina una unidad curricular de las aprobadas de un estudiante.
-
-        Args:
-            estudiante (Estudiante): Estudiante al que se le eliminará la UC regular.
-            codigo_uc (str): Código de la unidad curricular a eliminar.
-        """
-        uc = estudiante.plan.buscar_uc_por_codigo(codigo_uc)
-        if uc in estudiante.ucs_aprobadas:
-            estudiante.ucs_aprobadas.remove(uc)
-            print(f"✔ {uc.nombre} fue removida de las UCs aprobadas de {estudiante.nombre}.")
-        else:
-            print(f"✖ {uc.nombre} no está en las UCs aprobadas de {estudiante.nombre}.")
-                
-    def agregar_uc_aprobada(self, estudiante, codigo_uc):
-        """
-        Añade una unidad curricular aprobada a un estudiante.
-
-        Args:
-            estudiante (Estudiante): Estudiante al que se le agregará la UC aprobada.
-            codigo_uc (str): Código de la unidad curricular aprobada.
-        """
-        uc = estudiante.plan.buscar_uc_por_codigo(codigo_uc)
-        if uc not in estudiante.ucs_aprobadas:
-            estudiante.ucs_aprobadas.append(uc)
-            print(f"✔ {uc.nombre} fue agregada correctamente a las UCs aprobadas de {estudiante.nombre}.")
-        else:
-            print(f"✖ {estudiante.nombre} ya había aprobado la UC {uc.nombre}.")
-    
-    def agregar_uc_regular(self, estudiante, codigo_uc):
-        """
-        Añade una unidad curricular regular a un estudiante.
-
-        Args:
-            estudiante (Estudiante): Estudiante al que se le agregará la UC aprobada.
-            codigo_uc (str): Código de la unidad curricular aprobada.
-        """
-        uc = estudiante.plan.buscar_uc_por_codigo(codigo_uc)
-        if uc not in estudiante.ucs_regulares:
-            estudiante.ucs_regulares.append(uc)
-            print(f"✔ {uc.nombre} fue agregada correctamente a las UCs regulares de {estudiante.nombre}.")
-        else:
-            print(f"✖ {estudiante.nombre} ya estaba regular en la UC {uc.nombre}.")
-
 
     def crear_curso(self, codigo_uc, año, semestre, plan):
         """
@@ -734,11 +1423,11 @@ class Coordinadora(Persona):
             Curso: El curso creado si es válido, o None si no es válido.
         """
 
-        curso = Curso(codigo_uc, año, semestre, plan)
+        curso = Curso.crear_y_persistir(codigo_uc, año, semestre, plan)
         if curso.curso_valido():
             return curso
         else:
-            print("No se pudo crear el curso.")
+            log.error("No se pudo crear el curso.")
             return None
     
     def crear_instancia_examen(self, codigo_uc, fecha,hora, plan):
@@ -759,10 +1448,12 @@ class Coordinadora(Persona):
             examen = InstanciaDeExamen(codigo_uc, fecha,hora)
             return examen
         else:
-            print(f"No se encontró la unidad curricular {codigo_uc} en el plan.")
+            log.error("No se encontró la unidad curricular %s en el plan.", codigo_uc)
             return None
 
-class Secretaria(Persona):
+class Secretaria(_GestionDeUCs, Persona):
+    __slots__ = ()  # Sin atributos propios: solo los de Persona
+
     def __init__(self, nombre, apellido):
         super().__init__(nombre, apellido)
 
@@ -775,13 +1466,13 @@ class Secretaria(Persona):
             examen (InstanciaDeExamen): Examen al que desea inscribirse.
         """
         if isinstance(estudiante, Estudiante):
-            uc = estudiante.plan.buscar_uc_por_codigo(examen.codigo_uc)
-            if uc and uc in estudiante.ucs_regulares:
+            codigo_uc, regulares = examen.codigo_uc, estudiante.ucs_regulares #se leen una sola vez
+            if codigo_uc in regulares: #se consulta el registro del estudiante, sin pasar por el plan
                 estudiante.inscribirse_a_examen(examen)
             else:
-                print(f"{estudiante.nombre} no está regular en la UC {uc.codigo}, no puede inscribirse al examen.")
+                log.warning("%s no está regular en la UC %s, no puede inscribirse al examen.", estudiante.nombre, codigo_uc)
         else:
-            print("No existe estudiante.")
+            log.error("No existe estudiante.")
 
         
     def inscribir_a_curso(self, estudiante, curso):
@@ -793,18 +1484,65 @@ class Secretaria(Persona):
             curso (Curso): Curso al que desea inscribirse.
         """
         if not isinstance(estudiante, Estudiante):
-            print("El objeto proporcionado no es un Estudiante.")
+            log.error("El objeto proporcionado no es un Estudiante.")
             return
 
         if not isinstance(curso, Curso) or not curso.curso_valido():
-            print("El curso no es válido.")
+            log.error("El curso no es válido.")
             return
 
-        if estudiante._puede_inscribirse(curso.codigo_uc):
-            estudiante.ucs_cursando.append(curso.uc)
+        codigo_uc, uc = curso.codigo_uc, curso.uc #se leen una sola vez del curso
+        if estudiante._puede_inscribirse(codigo_uc):
+            estudiante._agregar_cursando(uc)
             curso.agregar_estudiante(estudiante)
         else:
-            print(f"{estudiante.nombre} no puede inscribirse al curso {curso.codigo_uc}")
+            log.warning("%s no puede inscribirse al curso %s", estudiante.nombre, codigo_uc)
+
+    def inscribir_cohorte_a_curso(self, estudiantes, curso):
+        """
+        Inscribe a un curso a todos los estudiantes de una cohorte que cumplan con los requisitos.
+        El curso se valida una sola vez y los inscritos se agregan al curso de una sola vez.
+
+        Args:
+            estudiantes (iterable of Estudiante): Estudiantes que desean inscribirse al curso.
+            curso (Curso): Curso al que desean inscribirse.
+
+        Returns:
+            list of Estudiante: Los estudiantes que quedaron inscritos.
+        """
+        if not isinstance(curso, Curso) or not curso.curso_valido():
+            log.error("El curso no es válido.")
+            return []
+
+        codigo_uc, uc = curso.codigo_uc, curso.uc #se leen una sola vez para toda la cohorte
+        habilitados = []
+        with salida_agrupada():
+            for estudiante in estudiantes:
+                if not isinstance(estudiante, Estudiante):
+                    log.error("El objeto proporcionado no es un Estudiante.")
+                elif estudiante._puede_inscribirse(codigo_uc):
+                    estudiante._agregar_cursando(uc)
+                    habilitados.append(estudiante)
+                else:
+                    log.warning("%s no puede inscribirse al curso %s", estudiante.nombre, codigo_uc)
+            return curso.agregar_estudiantes(habilitados) #dentro del bloque: todos los mensajes se escriben juntos
+
+    def inscribir_cohorte_a_examen(self, estudiantes, examen):
+        """
+        Inscribe a un examen a todos los estudiantes de una cohorte que estén regulares en la UC.
+        Los inscritos se agregan al examen de una sola vez; el examen verifica a cada estudiante.
+
+        Args:
+            estudiantes (iterable of Estudiante): Estudiantes que desean inscribirse al examen.
+            examen (InstanciaDeExamen): Examen al que desean inscribirse.
+
+        Returns:
+            list of Estudiante: Los estudiantes que quedaron inscritos.
+        """
+        if not isinstance(examen, InstanciaDeExamen):
+            log.error("Instancia de examen no válida.")
+            return []
+        return examen.agregar_estudiantes(estudiantes) #el examen ya controla que cada estudiante esté regular
 
     def ver_plan(self, plan):
         """
@@ -832,63 +1570,3 @@ class Secretaria(Persona):
             examen (InstanciaDeExamen): Examen del que se desea ver los estudiantes inscritos.
         """
         examen.mostrar_estudiantes()
-    
-    def quitar_uc_regular(self, estudiante, codigo_uc):
-        """
-        Elimina una unidad curricular de las regulares de un estudiante.
-
-        Args:
-            estudiante (Estudiante): Estudiante al que se le eliminará la UC regular.
-            codigo_uc (str): Código de la unidad curricular a eliminar.
-        """
-        uc = estudiante.plan.buscar_uc_por_codigo(codigo_uc)
-        if uc in estudiante.ucs_regulares:
-            estudiante.ucs_regulares.remove(uc)
-            print(f"✔ {uc.nombre} fue removida de las UCs regulares de {estudiante.nombre}.")
-        else:
-            print(f"✖ {uc.nombre} no está en las UCs regulares de {estudiante.nombre}.")
-    
-    def quitar_uc_aprobada(self, estudiante, codigo_uc):
-        """
-        Elimina una unidad curricular de las aprobadas de un estudiante.
-
-        Args:
-            estudiante (Estudiante): Estudiante al que se le eliminará la UC regular.
-            codigo_uc (str): Código de la unidad curricular a eliminar.
-        """
-        uc = estudiante.plan.buscar_uc_por_codigo(codigo_uc)
-        if uc in estudiante.ucs_aprobadas:
-            estudiante.ucs_aprobadas.remove(uc)
-            print(f"✔ {uc.nombre} fue removida de las UCs aprobadas de {estudiante.nombre}.")
-        else:
-            print(f"✖ {uc.nombre} no está en las UCs aprobadas de {estudiante.nombre}.")
-                
-    def agregar_uc_aprobada(self, estudiante, codigo_uc):
-        """
-        Añade una unidad curricular aprobada a un estudiante.
-
-        Args:
-            estudiante (Estudiante): Estudiante al que se le agregará la UC aprobada.
-            codigo_uc (str): Código de la unidad curricular aprobada.
-        """
-        uc = estudiante.plan.buscar_uc_por_codigo(codigo_uc)
-        if uc not in estudiante.ucs_aprobadas:
-            estudiante.ucs_aprobadas.append(uc)
-            print(f"✔ {uc.nombre} fue agregada correctamente a las UCs aprobadas de {estudiante.nombre}.")
-        else:
-            print(f"✖ {estudiante.nombre} ya había aprobado la UC {uc.nombre}.")
-    
-    def agregar_uc_regular(self, estudiante, codigo_uc):
-        """
-        Añade una unidad curricular regular a un estudiante.
-
-        Args:
-            estudiante (Estudiante): Estudiante al que se le agregará la UC aprobada.
-            codigo_uc (str): Código de la unidad curricular aprobada.
-        """
-        uc = estudiante.plan.buscar_uc_por_codigo(codigo_uc)
-        if uc not in estudiante.ucs_regulares:
-            estudiante.ucs_regulares.append(uc)
-            print(f"✔ {uc.nombre} fue agregada correctamente a las UCs regulares de {estudiante.nombre}.")
-        else:
-            print(f"✖ {estudiante.nombre} ya estaba regular en la UC {uc.nombre}.")